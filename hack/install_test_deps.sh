@@ -2,24 +2,44 @@
 
 set -e
 
-go install github.com/onsi/ginkgo/v2/ginkgo@$(go list -f '{{.Version}}' -m github.com/onsi/ginkgo/v2)
-go install go.uber.org/mock/mockgen@v0.3.0
+# Directory where the downloaded binaries will be installed:
+bin_dir="$(go env GOPATH)/bin"
 
-if ! [ -x "$(command -v golangci-lint)" ]; then
-    echo "Downloading golangci-lint"
+# The Go tools are independent of each other, so install them in parallel. Note that `wait` needs
+# to be called for each process separately, otherwise failures would be ignored.
+go install github.com/onsi/ginkgo/v2/ginkgo@$(go list -f '{{.Version}}' -m github.com/onsi/ginkgo/v2) &
+ginkgo_pid=$!
+go install go.uber.org/mock/mockgen@v0.3.0 &
+mockgen_pid=$!
+wait ${ginkgo_pid}
+wait ${mockgen_pid}
 
-    curl -Lo tarball https://github.com/golangci/golangci-lint/releases/download/v1.55.2/golangci-lint-1.55.2-linux-amd64.tar.gz
-    echo ca21c961a33be3bc15e4292dc40c98c8dcc5463a7b6768a3afc123761630c09c tarball | sha256sum -c
-    tar -C $(go env GOPATH)/bin --strip-components=1 -xf tarball golangci-lint-1.55.2-linux-amd64/golangci-lint
-    rm tarball
-fi
+function install_golangci_lint {
+    if ! [ -x "$(command -v golangci-lint)" ]; then
+        echo "Downloading golangci-lint"
 
+        curl -Lo tarball https://github.com/golangci/golangci-lint/releases/download/v1.55.2/golangci-lint-1.55.2-linux-amd64.tar.gz
+        echo ca21c961a33be3bc15e4292dc40c98c8dcc5463a7b6768a3afc123761630c09c tarball | sha256sum -c
+        tar -C ${bin_dir} --strip-components=1 -xf tarball golangci-lint-1.55.2-linux-amd64/golangci-lint
+        rm tarball
+    fi
+}
 
-if ! [ -x "$(command -v spectral)" ]; then
-    echo "Downloading spectral"
+function install_spectral {
+    if ! [ -x "$(command -v spectral)" ]; then
+        echo "Downloading spectral"
 
-    curl -Lo spectral https://github.com/stoplightio/spectral/releases/download/v6.11.0/spectral-linux-x64
-    echo 0e151d3dc5729750805428f79a152fa01dd4c203f1d9685ef19f4fd4696fcd5f spectral | sha256sum -c
-    chmod +x spectral
-    mv spectral $(go env GOPATH)/bin
-fi
+        curl -Lo spectral https://github.com/stoplightio/spectral/releases/download/v6.11.0/spectral-linux-x64
+        echo 0e151d3dc5729750805428f79a152fa01dd4c203f1d9685ef19f4fd4696fcd5f spectral | sha256sum -c
+        chmod +x spectral
+        mv spectral ${bin_dir}
+    fi
+}
+
+# The downloads are independent of each other, so run them in parallel as well:
+install_golangci_lint &
+golangci_lint_pid=$!
+install_spectral &
+spectral_pid=$!
+wait ${golangci_lint_pid}
+wait ${spectral_pid}